@@ -1,5 +1,17 @@
+import asyncio
+import os
+import ssl
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 
+import aiohttp
+import orjson
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from requests import Response
+from requests.adapters import HTTPAdapter
 from rest_framework.request import Request
 from jira import JIRA
 
@@ -11,11 +23,104 @@ class Source(Enum):
     B = "b"
 
 
+class _ClientCache(TTLCache):
+    """
+    TTL cache of JIRA clients closing the session of every client it expires or evicts.
+    The client itself stays usable, so a caller still holding it reconnects on its next call.
+    """
+
+    def expire(self, time=None):
+        expired = super().expire(time) or ()
+        for _, client in expired:
+            client._session.close()
+        return expired
+
+    def popitem(self):
+        key, client = super().popitem()
+        client._session.close()
+        return key, client
+
+
+_CLIENT_CACHE: TTLCache[tuple[Source, str], JIRA] = _ClientCache(maxsize=512, ttl=300)
+_CLIENT_CACHE_LOCK = threading.RLock()
+_INFLIGHT: dict[tuple[Source, str], Future] = {}
+
+_EXEC = ThreadPoolExecutor(max_workers=10)
+_CPU = ThreadPoolExecutor(max_workers=os.cpu_count())
+_SESSIONS: dict[asyncio.AbstractEventLoop, dict[Source, aiohttp.ClientSession]] = {}
+_SESSIONS_LOCK = threading.Lock()
+_SPRINT_FIELDS = (
+    ("id", "id"),
+    ("name", "name"),
+    ("state", "state"),
+    ("start_date", "startDate"),
+    ("end_date", "endDate"),
+)
+
+
+class _OrjsonResponse(Response):
+    """
+    Response parsing its JSON body with orjson.
+    """
+
+    def json(self, **kwargs):
+        return orjson.loads(self.content)
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """
+    Requests response hook parsing the JSON bodies of the JIRA sessions with orjson.
+    """
+
+    response.__class__ = _OrjsonResponse
+    return response
+
+
+def _serialize_sprints(data: Iterable[dict]) -> list[dict]:
+    return [
+        {key: s.get(raw_key) for key, raw_key in _SPRINT_FIELDS}
+        for s in data
+    ]
+
+
+def _normalize_jira_user_response(jira_response: dict) -> dict:
+    data = {}
+    data["username"] = jira_response["name"]
+    data["email"] = jira_response["emailAddress"]
+    data["avatar"] = jira_response["avatarUrls"]["48x48"]
+    data["full_name"] = jira_response["displayName"]
+    return data
+
+
+def _normalize_jira_issues_response(jira_response: dict) -> list[dict]:
+    jira_response.pop("expand", None)
+
+    users = {}
+
+    def normalize_user(jira_user: dict) -> dict:
+        user = users.get(jira_user["name"])
+        if user is None:
+            user = users[jira_user["name"]] = _normalize_jira_user_response(jira_user)
+        return user
+
+    return [
+        {
+            "key": i["key"],
+            "summary": (f := i["fields"])["summary"],
+            "reporter": normalize_user(r) if (r := f.get("reporter")) else None,
+            "status": f["status"].get("name"),
+            "priority": f["priority"].get("name"),
+            "created": f.get("created"),
+        }
+        for i in jira_response["issues"]
+    ]
+
+
 class Jira:
     """
     Wrapper class for the Jira API, providing methods for interacting with Jira issues, comments,
-    transitions, sprints, and boards. This class implements the singleton pattern, meaning that 
-    only one instance of the class will exist at a time.
+    transitions, sprints, and boards. Instances are cheap to create, as the only shared state is
+    the process-wide cache of authenticated connections keyed by source and user.
 
     :param request: Request object containing information about the user making the API call.
     :type request: Request
@@ -23,17 +128,21 @@ class Jira:
     :type source: Source
 
     :ivar source: Source of the Jira instance.
-    :ivar request: Request object containing information about the user making the API call.
+    :ivar user: Username of the user making the API call.
     :ivar auth_jira: JIRA object representing the authenticated connection to the Jira API.
     """
 
-    _instance = None
+    __slots__ = ("source", "user", "auth_jira")
+
+    _ISSUE_FIELDS = ("summary", "reporter", "status", "priority", "created")
+    _HIGH_PRIORITY = {"id": "2"}
+    _LOW_PRIORITY = {"id": "4"}
 
     def __init__(self, request: Request, source: Source) -> None:
         """
         Wrapper class for the Jira API, providing methods for interacting with Jira issues, comments,
-        transitions, sprints, and boards. This class implements the singleton pattern, meaning that 
-        only one instance of the class will exist at a time.
+        transitions, sprints, and boards. Instances are cheap to create, as the only shared state is
+        the process-wide cache of authenticated connections keyed by source and user.
 
         :param request: Request object containing information about the user making the API call.
         :type request: Request
@@ -41,73 +150,99 @@ class Jira:
         :type source: Source
 
         :ivar source: Source of the Jira instance.
-        :ivar request: Request object containing information about the user making the API call.
+        :ivar user: Username of the user making the API call.
         :ivar auth_jira: JIRA object representing the authenticated connection to the Jira API.
-        """
 
-        self.source = source
-        self.request = request
-        self.auth_jira = self.__define_connection_source()
-
-    def __new__(cls, *args, **kwargs):
-        """
-        Singleton pattern implementation to ensure only one instance of the JIRA client is created during runtime.
+        :raises ValueError: If an invalid source is provided.
         """
 
-        if not cls._instance:
-            cls._instance = super(Jira, cls).__new__(cls)
-        return cls._instance
+        self.source = source = Source(source)
+        self.user = request.user.username
+        self.auth_jira = self.__define_connection_source(source, self.user)
 
-    def __define_connection_source(self) -> JIRA:
+    def __define_connection_source(self, source: Source, user: str) -> JIRA:
         """
         Method to define the JIRA connection source based on the provided source enum.
-
-        :raises ValueError: If an invalid source is provided.
+        Connections are cached per source and user, so repeated calls reuse the same session,
+        and concurrent calls for the same source and user wait for a single connection to be made.
+        Each session keeps up to 50 pooled connections per host for concurrent calls.
         """
 
-        if self.source == Source.A:
-            auth_jira = self.__connect_to_a()
-        elif self.source == Source.B:
-            auth_jira = self.__connect_to_b()
-        else:
-            raise ValueError("Invalid source: {}".format(self.source))
+        key = (source, user)
+        with _CLIENT_CACHE_LOCK:
+            auth_jira = _CLIENT_CACHE.get(key)
+            if auth_jira is not None:
+                return auth_jira
+            future = _INFLIGHT.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = _INFLIGHT[key] = Future()
+        if not is_owner:
+            return future.result()
+
+        try:
+            auth_jira = self._CONNECTORS[source](self, user)
+            auth_jira._session.hooks["response"].append(_orjson_response_hook)
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+            auth_jira._session.mount("https://", adapter)
+            auth_jira._session.mount("http://", adapter)
+        except BaseException as e:
+            with _CLIENT_CACHE_LOCK:
+                _INFLIGHT.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with _CLIENT_CACHE_LOCK:
+            _CLIENT_CACHE[key] = auth_jira
+            _INFLIGHT.pop(key, None)
+        future.set_result(auth_jira)
         return auth_jira
 
-    def __connect_to_b(self) -> JIRA:
+    def __connect_to_b(self, user: str) -> JIRA:
         """
         Connects to the B JIRA instance.
 
+        :param user: Username sent as the context user of the requests.
+        :type user: str
         :return: JIRA object representing the authenticated connection to the B JIRA instance.
         """
 
         auth_jira = JIRA(
             options={
                 "server": settings.B["url"],
-                "verify": False,
-                "headers": {"contextUser": self.request.user.username}
+                "verify": settings.B.get("verify", True),
+                "headers": {"contextUser": user}
             },
             basic_auth=(settings.B["username"],
-                        settings.B["password"])
+                        settings.B["password"]),
+            async_=True,
+            async_workers=getattr(settings, "JIRA_ASYNC_WORKERS", 5),
         )
         return auth_jira
 
-    def __connect_to_a(self) -> JIRA:
+    def __connect_to_a(self, user: str) -> JIRA:
         """
         Connects to the A JIRA instance.
 
+        :param user: Username sent as the context user of the requests.
+        :type user: str
         :return: JIRA object representing the authenticated connection to the A JIRA instance.
         """
 
         auth_jira = JIRA(
             options={
                 "server": settings.A["url"],
-                "verify": False,
-                "headers": {"contextUser": self.request.user.username}
+                "verify": settings.A.get("verify", True),
+                "headers": {"contextUser": user}
             },
-            basic_auth=(settings.A["username"], settings.A["password"])
+            basic_auth=(settings.A["username"], settings.A["password"]),
+            async_=True,
+            async_workers=getattr(settings, "JIRA_ASYNC_WORKERS", 5),
         )
         return auth_jira
 
+    _CONNECTORS = {Source.A: __connect_to_a, Source.B: __connect_to_b}
+
     def create_ticket(self, data: dict) -> str:
         """
         Creates a new ticket in Jira and returns its key.
@@ -118,13 +253,7 @@ class Jira:
         :rtype: str
         """
 
-        if self.source == Source.A:
-            issue = self.__create_ticket_in_a(data)
-        elif self.source == Source.B:
-            issue = self.__create_ticket_in_b(data)
-        else:
-            raise ValueError("Invalid source: {}".format(self.source))
-        return issue.key
+        return self._CREATORS[self.source](self, data)
 
     def __create_ticket_in_a(self, data: dict) -> str:
         """
@@ -157,15 +286,15 @@ class Jira:
             project={"id": 10407},
             issuetype={"id": 16704},
             summary=data["name"],
-            reporter={"name": self.request.user.username},
-            customfield_23249="{} , {}, {}".format(
-                data["as_a"], data["i_want"], data["so_that"]),
+            reporter={"name": self.user},
+            customfield_23249=f'{data["as_a"]} , {data["i_want"]}, {data["so_that"]}',
             customfield_23250=data["product"].get("name"),
-            priority={"id": "2"} if data["is_high_priority"] else {
-                "id": "4"},
+            priority=self._HIGH_PRIORITY if data["is_high_priority"] else self._LOW_PRIORITY,
         )
         return issue.key
 
+    _CREATORS = {Source.A: __create_ticket_in_a, Source.B: __create_ticket_in_b}
+
     def add_comment(self, comment: str, issue_key: str) -> None:
         """
         Adds a comment to the specified Jira issue.
@@ -190,6 +319,27 @@ class Jira:
 
         self.auth_jira.transition_issue(issue=issue_key, transition=transition)
 
+    def add_comments(self, pairs: list[tuple[str, str]]) -> None:
+        """
+        Adds comments to several Jira issues concurrently.
+
+        :param pairs: List of (comment, issue_key) tuples.
+        :type pairs: list[tuple[str, str]]
+        """
+
+        list(_EXEC.map(lambda p: self.auth_jira.add_comment(p[1], p[0]), pairs))
+
+    def change_transitions(self, pairs: list[tuple[int, str]]) -> None:
+        """
+        Changes the status of several Jira issues concurrently.
+
+        :param pairs: List of (transition, issue_key) tuples.
+        :type pairs: list[tuple[int, str]]
+        """
+
+        list(_EXEC.map(
+            lambda p: self.auth_jira.transition_issue(issue=p[1], transition=p[0]), pairs))
+
     def create_issue_link(
         self, issue_link_type: str, inward_issue_key: str, outward_issue_key: str
     ) -> None:
@@ -215,9 +365,15 @@ class Jira:
 
         self.auth_jira.add_issues_to_sprint(sprint_id, issue_keys)
 
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=60),
+        key=lambda self, product_id: hashkey(self.source, self.user, product_id),
+        lock=threading.Lock(),
+    )
     def get_first_board(self, product_id: int) -> int:
         """
         Returns the ID of the first board associated with the specified Jira project.
+        Results are cached per source and user for one minute.
 
         :param product_id: ID of the Jira project to retrieve the first board for.
         :type product_id: int
@@ -233,6 +389,7 @@ class Jira:
     def get_sprints(self, board_id: int, state: str) -> list[dict]:
         """
         Returns a list of sprints for a given board.
+        Results are cached per source and user for one minute.
 
         :param board_id: ID of the board.
         :type board_id: int
@@ -242,55 +399,290 @@ class Jira:
         :rtype: List[dict]
         """
 
+        return [dict(s) for s in self.__get_sprints(board_id, state)]
+
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=60),
+        key=lambda self, board_id, state: hashkey(self.source, self.user, board_id, state),
+        lock=threading.Lock(),
+    )
+    def __get_sprints(self, board_id: int, state: str) -> tuple[dict, ...]:
         res = self.auth_jira.sprints(board_id, state=state)
 
-        sprints = self.__sprint_serializer(res)
+        sprints = tuple(_serialize_sprints(s.raw for s in res))
 
         return sprints
 
-    def __sprint_serializer(self, data) -> list[dict]:
-        sprints = []
-        for s in data:
-            sprint = {"id": s.id, "name": s.name, "state": s.state,
-                      "start_date": s.startDate, "end_date": s.endDate}
-            sprints.append(sprint)
-
-        return sprints
+    def search_issues(
+        self, jql: str, fields: list[str], start_at: int, max_results: int | bool = 10
+    ) -> list[dict]:
+        """
+        Returns the issues matching the given JQL query.
+
+        :param jql: JQL query to search issues with.
+        :type jql: str
+        :param fields: Unused, kept for compatibility. Exactly the fields used by the normalized
+            response are requested.
+        :type fields: list[str]
+        :param start_at: Index of the first issue to return.
+        :type start_at: int
+        :param max_results: Maximum number of issues to return, or False to fetch all of them.
+            Pages are fetched concurrently when all issues are requested.
+        :type max_results: int | bool
+        :return: List of normalized issues.
+        :rtype: list[dict]
+        """
 
-    def search_issues(self, jql: str, fields: list[str], start_at: int) -> dict:
-        res = self.auth_jira.search_issues(
-            jql, fields=fields, json_result=True, startAt=start_at, maxResults=10)
+        res = self.__fetch_issues(jql, start_at, max_results)
 
-        issues = self.__normalize_jira_issues_response(res)
+        issues = _normalize_jira_issues_response(res)
 
         return issues
 
-    def __normalize_jira_user_response(self, jira_response: dict) -> dict:
-        data = {}
-        data["username"] = jira_response["name"]
-        data["email"] = jira_response["emailAddress"]
-        data["avatar"] = jira_response["avatarUrls"]["48x48"]
-        data["full_name"] = jira_response["displayName"]
-        return data
-
-    def __normalize_jira_issues_response(self, jira_response) -> list[dict]:
-        if "expand" in jira_response:
-            del jira_response["expand"]
-
-        issues = []
-        for i in jira_response["issues"]:
-            issue = {}
-            issue["key"] = i["key"]
-            issue["summary"] = i["fields"]["summary"]
-            issue["reporter"] = (
-                self.__normalize_jira_user_response(
-                    i["fields"]["reporter"])
-                if i["fields"].get("reporter", None)
-                else None
+    def submit_search_issues(
+        self, jql: str, fields: list[str], start_at: int, max_results: int | bool = 10
+    ) -> Future:
+        """
+        Background variant of search_issues. The search is sent from the I/O pool and its response
+        is normalized on the CPU pool, so the calling thread is free until it needs the result.
+
+        :param jql: JQL query to search issues with.
+        :type jql: str
+        :param fields: Unused, kept for compatibility, see search_issues.
+        :type fields: list[str]
+        :param start_at: Index of the first issue to return.
+        :type start_at: int
+        :param max_results: Maximum number of issues to return, or False to fetch all of them.
+        :type max_results: int | bool
+        :return: Future resolving to the list of normalized issues.
+        :rtype: Future
+        """
+
+        result = Future()
+
+        def on_normalized(normalized: Future) -> None:
+            if normalized.exception() is not None:
+                result.set_exception(normalized.exception())
+            else:
+                result.set_result(normalized.result())
+
+        def on_fetched(fetched: Future) -> None:
+            if fetched.exception() is not None:
+                result.set_exception(fetched.exception())
+                return
+            _CPU.submit(
+                _normalize_jira_issues_response, fetched.result()
+            ).add_done_callback(on_normalized)
+
+        _EXEC.submit(
+            self.__fetch_issues, jql, start_at, max_results
+        ).add_done_callback(on_fetched)
+        return result
+
+    def get_issues_bulk(self, keys: list[str], fields: list[str]) -> list[dict]:
+        """
+        Returns the issues with the given keys. Keys are searched with "key in (...)" JQL
+        queries of up to 100 keys each, run concurrently, instead of one request per page.
+
+        :param keys: List of issue keys to retrieve.
+        :type keys: list[str]
+        :param fields: Unused, kept for compatibility, see search_issues.
+        :type fields: list[str]
+        :return: List of normalized issues. Keys that do not exist are skipped.
+        :rtype: list[dict]
+        """
+
+        def fetch(batch: list[str]) -> list[dict]:
+            res = self.auth_jira.search_issues(
+                "key in ({})".format(",".join('"{}"'.format(k) for k in batch)),
+                fields=list(self._ISSUE_FIELDS), expand="", json_result=True,
+                validate_query=False, maxResults=len(batch))
+            return _normalize_jira_issues_response(res)
+
+        batches = [keys[i:i + 100] for i in range(0, len(keys), 100)]
+        return [issue for issues in _EXEC.map(fetch, batches) for issue in issues]
+
+    def __fetch_issues(self, jql: str, start_at: int, max_results: int | bool) -> dict:
+        fields = list(self._ISSUE_FIELDS)
+        if max_results is False:
+            res = self.auth_jira.search_issues(
+                jql, fields=fields, expand="", startAt=start_at, maxResults=False)
+            return {"issues": [i.raw for i in res]}
+        return self.auth_jira.search_issues(
+            jql, fields=fields, expand="", json_result=True, startAt=start_at,
+            maxResults=max_results)
+
+
+class AsyncJira:
+    """
+    Asyncio counterpart of the Jira wrapper for the hot read and update paths. It calls the Jira
+    REST API directly through one aiohttp session per event loop and source, shared across
+    requests. Call close_sessions before an event loop is shut down.
+
+    :param request: Request object containing information about the user making the API call.
+    :type request: Request
+    :param source: Source of the Jira instance (A or B).
+    :type source: Source
+
+    :ivar source: Source of the Jira instance.
+    :ivar user: Username of the user making the API call.
+    """
+
+    __slots__ = ("source", "user", "__settings")
+
+    def __init__(self, request: Request, source: Source) -> None:
+        self.source = Source(source)
+        self.user = request.user.username
+        self.__settings = self.__define_settings()
+
+    def __define_settings(self) -> dict:
+        """
+        Method to define the JIRA settings based on the provided source enum.
+        """
+
+        if self.source == Source.A:
+            return settings.A
+        return settings.B
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the aiohttp session of the source for the running event loop, creating it on
+        first use. Must be called from within a running event loop.
+
+        Sessions of event loops that were closed without close_sessions are dropped here. Their
+        connections can no longer be closed through their loop, so the references are released
+        and the transports close their sockets when they are collected.
+        """
+
+        with _SESSIONS_LOCK:
+            for loop in [loop for loop in _SESSIONS if loop.is_closed()]:
+                del _SESSIONS[loop]
+            sessions = _SESSIONS.setdefault(asyncio.get_running_loop(), {})
+        session = sessions.get(self.source)
+        if session is None or session.closed:
+            verify = self.__settings.get("verify", True)
+            if isinstance(verify, str) and os.path.isdir(verify):
+                ssl_context = ssl.create_default_context(capath=verify)
+            elif isinstance(verify, str):
+                ssl_context = ssl.create_default_context(cafile=verify)
+            else:
+                ssl_context = ssl.create_default_context() if verify else False
+            session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth(self.__settings["username"], self.__settings["password"]),
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    ssl=ssl_context,
+                ),
+                raise_for_status=True,
             )
-            issue["status"] = i["fields"]["status"].get("name", None)
-            issue["priority"] = i["fields"]["priority"].get("name", None)
-            issue["created"] = i["fields"].get("created", None)
+            sessions[self.source] = session
+        return session
 
-            issues.append(issue)
-        return issues
+    @staticmethod
+    async def close_sessions() -> None:
+        """
+        Closes the aiohttp sessions opened from the running event loop, e.g. on ASGI lifespan
+        shutdown. New sessions are created if AsyncJira is used again afterwards.
+        """
+
+        with _SESSIONS_LOCK:
+            sessions = _SESSIONS.pop(asyncio.get_running_loop(), {})
+        for session in sessions.values():
+            await session.close()
+
+    async def __get(self, path: str, params: dict) -> dict:
+        async with self.__get_session().get(
+            self.__settings["url"].rstrip("/") + path,
+            params=params,
+            headers={"contextUser": self.user},
+        ) as r:
+            return await r.json(loads=orjson.loads)
+
+    async def __post(self, path: str, data: dict) -> None:
+        async with self.__get_session().post(
+            self.__settings["url"].rstrip("/") + path,
+            json=data,
+            headers={"contextUser": self.user},
+        ):
+            pass
+
+    async def add_comment(self, comment: str, issue_key: str) -> None:
+        """
+        Adds a comment to the specified Jira issue.
+
+        :param comment: Text of the comment to be added.
+        :type comment: str
+        :param issue_key: Key of the Jira issue to add the comment to.
+        :type issue_key: str
+        """
+
+        await self.__post("/rest/api/2/issue/{}/comment".format(issue_key), {"body": comment})
+
+    async def change_transition(self, transition: int, issue_key: str) -> None:
+        """
+        Changes the status of the specified Jira issue to the specified transition.
+
+        :param transition: ID of the transition to change the issue status to.
+        :type transition: int
+        :param issue_key: Key of the Jira issue to change the status of.
+        :type issue_key: str
+        """
+
+        await self.__post(
+            "/rest/api/2/issue/{}/transitions".format(issue_key),
+            {"transition": {"id": str(transition)}},
+        )
+
+    async def get_first_board(self, product_id: int) -> int:
+        """
+        Returns the ID of the first board associated with the specified Jira project.
+
+        :param product_id: ID of the Jira project to retrieve the first board for.
+        :type product_id: int
+        :return: ID of the first board associated with the project.
+        :rtype: int
+        """
+
+        res = await self.__get("/rest/agile/1.0/board", {"projectKeyOrId": str(product_id)})
+        return sorted(i["id"] for i in res["values"])[0]
+
+    async def get_sprints(self, board_id: int, state: str) -> list[dict]:
+        """
+        Returns a list of sprints for a given board.
+
+        :param board_id: ID of the board.
+        :type board_id: int
+        :param state: State of the sprints to retrieve (e.g. "active", "future", "closed)
+        :type state: str
+        :return: List of sprints for the given board.
+        :rtype: List[dict]
+        """
+
+        res = await self.__get("/rest/agile/1.0/board/{}/sprint".format(board_id), {"state": state})
+        return _serialize_sprints(res["values"])
+
+    async def search_issues(
+        self, jql: str, fields: list[str], start_at: int, max_results: int = 10
+    ) -> list[dict]:
+        """
+        Returns the issues matching the given JQL query.
+
+        :param jql: JQL query to search issues with.
+        :type jql: str
+        :param fields: Unused, kept for compatibility. Exactly the fields used by the normalized
+            response are requested.
+        :type fields: list[str]
+        :param start_at: Index of the first issue to return.
+        :type start_at: int
+        :param max_results: Maximum number of issues to return.
+        :type max_results: int
+        :return: List of normalized issues.
+        :rtype: list[dict]
+        """
+
+        res = await self.__get(
+            "/rest/api/2/search",
+            {"jql": jql, "fields": ",".join(Jira._ISSUE_FIELDS), "expand": "",
+             "startAt": start_at, "maxResults": max_results},
+        )
+        return _normalize_jira_issues_response(res)